@@ -1,30 +1,48 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
-from pkg_resources import get_distribution, DistributionNotFound
+from importlib.metadata import version as get_version, PackageNotFoundError
 try:
-    __version__ = get_distribution(__name__).version
-except DistributionNotFound:
-    pass  # package is not installed
+    __version__ = get_version(__name__)
+except PackageNotFoundError:
+    __version__ = 'unknown'  # package is not installed
 
 import cdflib
-import glob
+import importlib.util
 import os
 import pooch
 import requests
-import warnings
+import tempfile
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import sunpy
 
-from sunpy import config
-from sunpy.net import Fido
-from sunpy.net import attrs as a
-from sunpy.timeseries import TimeSeries
 
+# pyarrow is optional and only needed for caching parsed SEPT files as Parquet
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
 
-# omit Pandas' PerformanceWarning
-warnings.simplefilter(action='ignore', category=pd.errors.PerformanceWarning)
+# accepted name variations for spacecraft and species:
+_SC = {'a': 'ahead', 'sta': 'ahead', 'ahead': 'ahead',
+       'b': 'behind', 'stb': 'behind', 'behind': 'behind'}
+_SPECIES = {'e': 'ele', 'ele': 'ele',
+            'p': 'ion', 'h': 'ion', 'i': 'ion', 'ion': 'ion'}
+
+
+def _normalize(spacecraft, species=None):
+    """
+    Map variations of spacecraft ('a', 'sta', ...) and species ('e', 'p', ...) names to 'ahead'/'behind' and 'ele'/'ion'
+    """
+    try:
+        spacecraft = _SC[spacecraft.lower()]
+    except KeyError:
+        raise ValueError(f'"spacecraft" must be either "ahead" or "behind", not "{spacecraft}"!')
+    if species is not None:
+        try:
+            species = _SPECIES[species.lower()]
+        except KeyError:
+            raise ValueError(f'"species" must be either "e"lectrons or "p"rotons (resp. ions), not "{species}"!')
+    return spacecraft, species
 
 
 def resample_df(df, resample, pos_timestamp='center'):
@@ -32,11 +50,11 @@ def resample_df(df, resample, pos_timestamp='center'):
     Resample Pandas Dataframe
     """
     try:
+        # pandas' cythonized resample/groupby mean outperformed numbagg's group_nanmean and a NumPy
+        # reduceat implementation on SEPT-sized data, so it is kept here
         df = df.resample(resample).mean()
-        if pos_timestamp == 'start':
-            df.index = df.index
-        else:
-            df.index = df.index + pd.tseries.frequencies.to_offset(pd.Timedelta(resample)/2)
+        if pos_timestamp != 'start':
+            df.index = df.index + pd.Timedelta(resample)/2
         # if pos_timestamp == 'stop' or pos_timestamp == 'end':
         #     df.index = df.index + pd.tseries.frequencies.to_offset(pd.Timedelta(resample))
     except ValueError:
@@ -71,17 +89,11 @@ def stereo_sept_download(date, spacecraft, species, viewing, path=None):
         if not path[-1] == os.sep:
             path = f'{path}{os.sep}'
 
-    if species.lower() == 'e':
-        species = 'ele'
-    if species.lower() == 'p' or species.lower() == 'h' or species.lower() == 'i':
-        species = 'ion'
+    spacecraft, species = _normalize(spacecraft, species)
 
-    if spacecraft.lower() == 'ahead' or spacecraft.lower() == 'a':
-        base = "http://www2.physik.uni-kiel.de/STEREO/data/sept/level2/ahead/1min/"
-    elif spacecraft.lower() == 'behind' or spacecraft.lower() == 'b':
-        base = "http://www2.physik.uni-kiel.de/STEREO/data/sept/level2/behind/1min/"
+    base = f"http://www2.physik.uni-kiel.de/STEREO/data/sept/level2/{spacecraft}/1min/"
 
-    file = "sept_"+spacecraft.lower()+"_"+species.lower()+"_"+viewing.lower()+"_"+str(date.year)+"_"+date.strftime('%j')+"_1min_l2_v03.dat"
+    file = "sept_"+spacecraft+"_"+species+"_"+viewing.lower()+"_"+str(date.year)+"_"+date.strftime('%j')+"_1min_l2_v03.dat"
 
     url = base+str(date.year)+'/'+file
 
@@ -96,7 +108,103 @@ def stereo_sept_download(date, spacecraft, species, viewing, path=None):
     return downloaded_file
 
 
-def stereo_sept_loader(startdate, enddate, spacecraft, species, viewing, resample=None, path=None, all_columns=False, pos_timestamp=None):
+# channel dicts from Nina:
+_e_ch_strings = ['45.0-55.0 keV', '55.0-65.0 keV', '65.0-75.0 keV', '75.0-85.0 keV', '85.0-105.0 keV', '105.0-125.0 keV', '125.0-145.0 keV', '145.0-165.0 keV', '165.0-195.0 keV', '195.0-225.0 keV', '225.0-255.0 keV', '255.0-295.0 keV', '295.0-335.0 keV', '335.0-375.0 keV', '375.0-425.0 keV']
+_e_limits = np.array([ch.split(' keV')[0].split('-') for ch in _e_ch_strings], dtype=np.float64)
+_e_mean_E = np.sqrt(_e_limits[:, 0] * _e_limits[:, 1]).tolist()
+#
+_ECHANNELS = {'bins': [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16],
+              'ch_strings': _e_ch_strings,
+              'DE': [0.0100, 0.0100, 0.0100, 0.0100, 0.0200, 0.0200, 0.0200, 0.0200, 0.0300, 0.0300, 0.0300, 0.0400, 0.0400, 0.0400, 0.0500],
+              'mean_E': _e_mean_E}
+_p_ch_strings = ['84.1-92.7 keV', '92.7-101.3 keV', '101.3-110.0 keV', '110.0-118.6 keV', '118.6-137.0 keV', '137.0-155.8 keV', '155.8-174.6 keV', '174.6-192.6 keV', '192.6-219.5 keV', '219.5-246.4 keV', '246.4-273.4 keV', ' 273.4-312.0 keV', '312.0-350.7 keV', '350.7-389.5 keV', '389.5-438.1 keV', '438.1-496.4 keV', '496.4-554.8 keV', ' 554.8-622.9 keV', '622.9-700.7 keV', '700.7-788.3 keV', '788.3-875.8 keV', '875.8- 982.8 keV', '982.8-1111.9 keV', '1111.9-1250.8 keV', '1250.8-1399.7 keV', '1399.7-1578.4 keV', '1578.4-1767.0 keV', '1767.0-1985.3 keV', '1985.3-2223.6 keV', '2223.6-6500.0 keV']
+_p_limits = np.array([ch.split(' keV')[0].split('-') for ch in _p_ch_strings], dtype=np.float64)
+_p_mean_E = np.sqrt(_p_limits[:, 0] * _p_limits[:, 1]).tolist()
+#
+_PCHANNELS = {'bins': [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31],
+              'ch_strings': _p_ch_strings,
+              'DE': [0.0086, 0.0086, 0.0087, 0.0086, 0.0184, 0.0188, 0.0188, 0.018, 0.0269, 0.0269, 0.027, 0.0386, 0.0387, 0.0388, 0.0486, 0.0583, 0.0584, 0.0681, 0.0778, 0.0876, 0.0875, 0.107, 0.1291, 0.1389, 0.1489, 0.1787, 0.1886, 0.2183, 0.2383, 4.2764],
+              'mean_E': _p_mean_E}
+# :channel dicts from Nina
+
+# create Pandas Dataframes from channel dicts; these are shared between all calls of
+# stereo_sept_loader, so copy them before modifying:
+_ECHANNELS_DF = pd.DataFrame({k: _ECHANNELS[k] for k in ['ch_strings', 'DE', 'mean_E']},
+                             index=pd.Index(_ECHANNELS['bins'], name='bins'))
+_PCHANNELS_DF = pd.DataFrame({k: _PCHANNELS[k] for k in ['ch_strings', 'DE', 'mean_E']},
+                             index=pd.Index(_PCHANNELS['bins'], name='bins'))
+
+# column names in data files:
+_COL_NAMES_ELE = (('julian_date', 'year', 'frac_doy', 'hour', 'min', 'sec')
+                  + tuple(f'ch_{i}' for i in _ECHANNELS_DF.index)
+                  + tuple(f'err_ch_{i}' for i in _ECHANNELS_DF.index)
+                  + ('integration_time',))
+_COL_NAMES_ION = (('julian_date', 'year', 'frac_doy', 'hour', 'min', 'sec')
+                  + tuple(f'ch_{i}' for i in _PCHANNELS_DF.index)
+                  + tuple(f'err_ch_{i}' for i in _PCHANNELS_DF.index)
+                  + ('integration_time',))
+
+
+def _read_sept_file(file, col_names, all_columns=False, cache=True):
+    """
+    Read single STEREO/SEPT level 2 data file into Pandas dataframe with datetime index, replacing bad data with np.nan
+
+    Fluxes and their uncertainties are read as float32; unless all_columns is True, only these are returned.
+    If cache is True, the parsed dataframe is stored as Parquet file '<file>.parquet' next to the data file
+    and read from there on subsequent calls (requires pyarrow, otherwise cache is ignored)
+    """
+    cache = cache and _HAS_PYARROW
+    flux_cols = [c for c in col_names if c.startswith(('ch_', 'err_ch_'))]
+    columns = list(col_names) if all_columns else flux_cols
+    # fixed dtypes for all files, so that concatenating them doesn't upcast any column:
+    dtype = {c: np.float32 if c in flux_cols else np.float64 for c in col_names}
+
+    cache_file = f'{file}.parquet'
+    # ignore caches older than the data file (e.g., after it has been downloaded again)
+    if cache and os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(file):
+        try:
+            df = pd.read_parquet(cache_file, engine='pyarrow', columns=columns)
+            return df.astype({c: dtype[c] for c in columns})
+        except ImportError:
+            cache = False
+        except Exception:
+            # unreadable (e.g. truncated) cache, parse the data file and overwrite it
+            pass
+
+    # the cache always holds all columns, otherwise skip the unused ones already while parsing.
+    # julian_date (kept as float64 for precision) is needed to build the index in any case.
+    usecols = col_names if (cache or all_columns) else ['julian_date'] + flux_cols
+
+    # sep=r'\s+' is handled by the C tokenizer's whitespace mode (not the Python regex parser);
+    # pyarrow's CSV reader can't cope with the '#' header and runs of blanks without pre-filtering
+    df = pd.read_csv(file, header=None, sep=r'\s+', names=col_names, usecols=usecols, comment='#', engine='c',
+                     dtype=dtype, na_values=['-9999.900'], low_memory=False, memory_map=True)
+
+    # generate datetime index from Julian date (2440587.5 is the Julian date of the Unix epoch):
+    jd = df['julian_date'].to_numpy(dtype=np.float64)
+    ns = ((jd - 2440587.5) * 86400e9).astype('int64')
+    df.index = pd.DatetimeIndex(ns.view('datetime64[ns]'), name='time')
+
+    if cache:
+        # write to a temporary file first and move it into place, so that an interrupted or concurrent
+        # write never leaves a truncated cache behind; skip caching if 'path' isn't writable
+        tmp_file = None
+        try:
+            fd, tmp_file = tempfile.mkstemp(suffix='.tmp', prefix=f'{os.path.basename(cache_file)}.',
+                                            dir=os.path.dirname(os.path.abspath(cache_file)))
+            os.close(fd)
+            df.to_parquet(tmp_file, engine='pyarrow', compression='zstd')
+            os.replace(tmp_file, cache_file)
+        except (ImportError, OSError):
+            if tmp_file is not None and os.path.exists(tmp_file):
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+    return df[columns]
+
+
+def stereo_sept_loader(startdate, enddate, spacecraft, species, viewing, resample=None, path=None, all_columns=False, pos_timestamp=None, cache=True):
     """Loads STEREO/SEPT data and returns it as Pandas dataframe together with a dictionary providing the energy ranges per channel
 
     Parameters
@@ -117,98 +225,64 @@ def stereo_sept_loader(startdate, enddate, spacecraft, species, viewing, resampl
         local path where the files are/should be stored, by default None
     all_columns : boolean, optional
         if True provide all availalbe columns in returned dataframe, by default False
+    cache : boolean, optional
+        if True store parsed data files as Parquet files next to them and use these on subsequent calls
+        (requires pyarrow, otherwise ignored), by default True
 
     Returns
     -------
     df : Pandas dataframe
         dataframe with either 15 channels of electron or 30 channels of proton/ion fluxes and their respective uncertainties
     channels_dict_df : dict
-        Pandas dataframe giving details on the measurement channels
+        Pandas dataframe giving details on the measurement channels (shared between calls, use .copy() before modifying it)
     """
 
     # catch variation of input parameters:
-    if species.lower() == 'e':
-        species = 'ele'
-    if species.lower() == 'p' or species.lower() == 'h' or species.lower() == 'i':
-        species = 'ion'
-    if spacecraft.lower() == 'a' or spacecraft.lower() == 'sta':
-        spacecraft = 'ahead'
-    if spacecraft.lower() == 'b' or spacecraft.lower() == 'stb':
-        spacecraft = 'behind'
-
-    # channel dicts from Nina:
-    ch_strings = ['45.0-55.0 keV', '55.0-65.0 keV', '65.0-75.0 keV', '75.0-85.0 keV', '85.0-105.0 keV', '105.0-125.0 keV', '125.0-145.0 keV', '145.0-165.0 keV', '165.0-195.0 keV', '195.0-225.0 keV', '225.0-255.0 keV', '255.0-295.0 keV', '295.0-335.0 keV', '335.0-375.0 keV', '375.0-425.0 keV']
-    mean_E = []
-    for i in range(len(ch_strings)):
-        temp  = ch_strings[i].split(' keV')
-        clims = temp[0].split('-')
-        lower = float(clims[0])
-        upper = float(clims[1])
-        mean_E.append(np.sqrt(upper*lower))
-    #
-    echannels = {'bins': [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16],
-                 'ch_strings': ch_strings,
-                 'DE': [0.0100, 0.0100, 0.0100, 0.0100, 0.0200, 0.0200, 0.0200, 0.0200, 0.0300, 0.0300, 0.0300, 0.0400, 0.0400, 0.0400, 0.0500],
-                 'mean_E': mean_E}
-    pchannels = {'bins': [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31],
-                 'ch_strings': ['84.1-92.7 keV', '92.7-101.3 keV', '101.3-110.0 keV', '110.0-118.6 keV', '118.6-137.0 keV', '137.0-155.8 keV', '155.8-174.6 keV', '174.6-192.6 keV', '192.6-219.5 keV', '219.5-246.4 keV', '246.4-273.4 keV', ' 273.4-312.0 keV', '312.0-350.7 keV', '350.7-389.5 keV', '389.5-438.1 keV', '438.1-496.4 keV', '496.4-554.8 keV', ' 554.8-622.9 keV', '622.9-700.7 keV', '700.7-788.3 keV', '788.3-875.8 keV', '875.8- 982.8 keV', '982.8-1111.9 keV', '1111.9-1250.8 keV', '1250.8-1399.7 keV', '1399.7-1578.4 keV', '1578.4-1767.0 keV', '1767.0-1985.3 keV', '1985.3-2223.6 keV', '2223.6-6500.0 keV'],
-                 'DE': [0.0086, 0.0086, 0.0087, 0.0086, 0.0184, 0.0188, 0.0188, 0.018, 0.0269, 0.0269, 0.027, 0.0386, 0.0387, 0.0388, 0.0486, 0.0583, 0.0584, 0.0681, 0.0778, 0.0876, 0.0875, 0.107, 0.1291, 0.1389, 0.1489, 0.1787, 0.1886, 0.2183, 0.2383, 4.2764],
-                 'mean_E': [88.30, 96.90, 105.56, 114.22, 127.47, 146.10, 164.93, 183.38, 205.61, 232.56, 259.55, 292.06, 330.78, 369.59, 413.09, 466.34, 524.79, 587.86, 660.66, 743.21, 830.90, 927.76, 1045.36, 1179.31, 1323.16, 1486.37, 1670.04, 1872.97, 2101.07, 3801.76]}
-    # :channel dicts from Nina
+    spacecraft, species = _normalize(spacecraft, species)
 
     if species == 'ele':
-        channels_dict = echannels
+        channels_dict_df = _ECHANNELS_DF
+        col_names = _COL_NAMES_ELE
     elif species == 'ion':
-        channels_dict = pchannels
-
-    # create Pandas Dataframe from channels_dict:
-    channels_dict_df = pd.DataFrame.from_dict(channels_dict)
-    channels_dict_df.index = channels_dict_df.bins
-    channels_dict_df.drop(columns=['bins'], inplace=True)
-
-    # column names in data files:
-    # col_names = ['julian_date', 'year', 'frac_doy', 'hour', 'min', 'sec'] + \
-    #             [f'ch_{i}' for i in range(2, len(channels_dict['bins'])+2)] + \
-    #             [f'err_ch_{i}' for i in range(2, len(channels_dict['bins'])+2)] + \
-    #             ['integration_time']
-    col_names = ['julian_date', 'year', 'frac_doy', 'hour', 'min', 'sec'] + \
-                [f'ch_{i}' for i in channels_dict_df.index] + \
-                [f'err_ch_{i}' for i in channels_dict_df.index] + \
-                ['integration_time']
+        channels_dict_df = _PCHANNELS_DF
+        col_names = _COL_NAMES_ION
 
     if not path:
         path = sunpy.config.get('downloads', 'download_dir') + os.sep
+    # index locally available files by (year, doy) with a single pass over 'path':
+    local_files = {}
+    # match the lower-case names written by stereo_sept_download:
+    prefix = f'sept_{spacecraft}_{species}_{viewing.lower()}_'
+    if os.path.isdir(path):
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith('.dat'):
+                    parts = entry.name.split('_')
+                    # skip files not following 'sept_<sc>_<species>_<viewing>_<year>_<doy>_*.dat'
+                    if len(parts) < 7 or not (parts[4].isdigit() and parts[5].isdigit()):
+                        continue
+                    local_files[(int(parts[4]), int(parts[5]))] = entry.path
+
     # create list of files to load:
     dates = pd.date_range(start=startdate, end=enddate, freq='D')
-    filelist = []
-    for i, doy in enumerate(dates.day_of_year):
-        try:
-            file = glob.glob(f"{path}{os.sep}sept_{spacecraft}_{species}_{viewing}_{dates[i].year}_{doy}_*.dat")[0]
-        except IndexError:
-            # print(f"File not found locally from {path}, downloading from http://www2.physik.uni-kiel.de/STEREO/data/sept/level2/")
-            file = stereo_sept_download(dates[i], spacecraft, species, viewing, path)
-        if len(file) > 0:
-            filelist.append(file)
+    years = dates.year.to_numpy().tolist()
+    doys = dates.dayofyear.to_numpy().tolist()
+    filelist = [local_files.get((year, doy)) for year, doy in zip(years, doys)]
+
+    # download missing files in parallel:
+    missing = [i for i, file in enumerate(filelist) if file is None]
+    if len(missing) > 0:
+        # print(f"Files not found locally from {path}, downloading from http://www2.physik.uni-kiel.de/STEREO/data/sept/level2/")
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            downloaded = executor.map(lambda i: stereo_sept_download(dates[i], spacecraft, species, viewing, path), missing)
+            for i, file in zip(missing, downloaded):
+                filelist[i] = file
+    filelist = [file for file in filelist if len(file) > 0]
     if len(filelist) > 0:
-        filelist = np.sort(filelist)
-
-        # read files into Pandas dataframes:
-        df = pd.read_csv(filelist[0], header=None, sep=r'\s+', names=col_names, comment='#')
-        if len(filelist) > 1:
-            for file in filelist[1:]:
-                t_df = pd.read_csv(file, header=None, sep=r'\s+', names=col_names, comment='#')
-                df = pd.concat([df, t_df])
-
-        # generate datetime index from Julian date:
-        df.index = pd.to_datetime(df['julian_date'], origin='julian', unit='D')
-        df.index.name = 'time'
-
-        # drop some unused columns:
-        if not all_columns:
-            df = df.drop(columns=['julian_date', 'year', 'frac_doy', 'hour', 'min', 'sec', 'integration_time'])
-
-        # replace bad data with np.nan:
-        df = df.replace(-9999.900, np.nan)
+        # read files into Pandas dataframes (in parallel, parsing releases the GIL):
+        with ThreadPoolExecutor(max_workers=min(8, len(filelist))) as executor:
+            frames = list(executor.map(lambda file: _read_sept_file(file, col_names, all_columns, cache), filelist))
+        df = pd.concat(frames)
 
         # careful!
         # adjusting the position of the timestamp manually.
@@ -273,6 +347,62 @@ def stereo_sept_loader(startdate, enddate, spacecraft, species, viewing, resampl
 #     return metadata
 
 
+def _read_cdf(files):
+    """
+    Read CDF files directly with cdflib into a single Pandas dataframe, avoiding the intermediate astropy
+    table (and copy) of sunpy's TimeSeries. Like sunpy's CDF reader, all variables depending on the time
+    index are used, 2D variables are split into columns '<var>_<i>', and FILLVAL of float variables is
+    replaced with np.nan, while variables without records are skipped. Returns None if the files don't share
+    a single time index and set of variables (or a variable doesn't match the length of the time index),
+    so that the caller can fall back to TimeSeries.
+    """
+    if len(files) == 0:
+        return None
+    arrays = {}
+    times = []
+    for file in files:
+        cdf = cdflib.CDF(file)
+        info = cdf.cdf_info()
+        if isinstance(info, dict):  # cdflib < 1.0
+            var_keys = info['rVariables'] + info['zVariables']
+        else:
+            var_keys = info.rVariables + info.zVariables
+        var_attrs = {key: cdf.varattsget(key) for key in var_keys}
+        var_keys = sorted(key for key in var_keys if var_attrs[key].get('DEPEND_0') is not None)
+        index_keys = set(var_attrs[key]['DEPEND_0'] for key in var_keys)
+        if len(index_keys) != 1:
+            return None
+        index_key = index_keys.pop()
+        times.append(pd.DatetimeIndex(cdflib.cdfepoch.to_datetime(cdf.varget(index_key))))
+
+        columns = {}
+        for key in var_keys:
+            # skip variables without any records, like sunpy does
+            var_info = cdf.varinq(key)
+            last_rec = var_info['Last_Rec'] if isinstance(var_info, dict) else var_info.Last_Rec
+            if last_rec == -1:
+                continue
+            data = cdf.varget(key)
+            if not isinstance(data, np.ndarray) or data.ndim > 2 or len(data) != len(times[-1]):
+                return None
+            if np.issubdtype(data.dtype, np.floating) and 'FILLVAL' in var_attrs[key]:
+                if not data.flags.writeable:
+                    data = data.copy()
+                data[data == var_attrs[key]['FILLVAL']] = np.nan
+            if data.ndim == 2:
+                for i, col in enumerate(data.T):
+                    columns[f'{key}_{i}'] = col
+            else:
+                columns[key] = data
+        if len(arrays) > 0 and columns.keys() != arrays.keys():
+            return None
+        for col, data in columns.items():
+            arrays.setdefault(col, []).append(data)
+
+    index = pd.DatetimeIndex(np.concatenate([t.values for t in times]), name=index_key)
+    return pd.DataFrame({col: np.concatenate(data) for col, data in arrays.items()}, index=index)
+
+
 def _get_metadata(dataset, path_to_cdf):
     """
     Get meta data from single cdf file
@@ -306,7 +436,7 @@ def _get_metadata(dataset, path_to_cdf):
     return metadata
 
 
-def stereo_load(instrument, startdate, enddate, spacecraft='ahead', mag_coord='RTN', sept_species='e', sept_viewing='sun', path=None, resample=None, pos_timestamp=None, max_conn=5):
+def stereo_load(instrument, startdate, enddate, spacecraft='ahead', mag_coord='RTN', sept_species='e', sept_viewing='sun', path=None, resample=None, pos_timestamp=None, max_conn=5, cache=True):
     """
     Downloads CDF files via SunPy/Fido from CDAWeb for HET, LET, MAG, and SEPT onboard STEREO
 
@@ -338,6 +468,9 @@ def stereo_load(instrument, startdate, enddate, spacecraft='ahead', mag_coord='R
         Viewing direction for SEPT: 'sun', 'asun', 'north', or 'south', by default 'sun'
     path : {str}, optional
         Local path for storing downloaded data, by default None
+    cache : {bool}, optional
+        SEPT only: store parsed data files as Parquet files next to them and use these on subsequent calls
+        (requires pyarrow, otherwise ignored), by default True
     resample : {str}, optional
         resample frequency in format understandable by Pandas, e.g. '1min', by default None
     pos_timestamp : {str}, optional
@@ -359,10 +492,7 @@ def stereo_load(instrument, startdate, enddate, spacecraft='ahead', mag_coord='R
         raise ValueError(f'"pos_timestamp" must be either None, "center", or "start"!')
 
     # find name variations
-    if spacecraft.lower()=='a' or spacecraft.lower()=='sta':
-        spacecraft='ahead'
-    if spacecraft.lower()=='b' or spacecraft.lower()=='stb':
-        spacecraft='behind'
+    spacecraft, _ = _normalize(spacecraft)
 
     if instrument.upper()=='SEPT':
         df, channels_dict_df = stereo_sept_loader(startdate=startdate,
@@ -373,9 +503,14 @@ def stereo_load(instrument, startdate, enddate, spacecraft='ahead', mag_coord='R
                                                   resample=resample,
                                                   path=path,
                                                   all_columns=False,
-                                                  pos_timestamp=pos_timestamp)
+                                                  pos_timestamp=pos_timestamp,
+                                                  cache=cache)
         return df, channels_dict_df
     else:
+        # sunpy.net is slow to import and only needed here
+        from sunpy.net import Fido
+        from sunpy.net import attrs as a
+
         # define spacecraft string
         sc = 'ST' + spacecraft.upper()[0]
 
@@ -404,8 +539,11 @@ def stereo_load(instrument, startdate, enddate, spacecraft='ahead', mag_coord='R
                     downloaded_file = Fido.fetch(result[0][i], path=path, max_conn=max_conn)
 
             # downloaded_files = Fido.fetch(result, path=path, max_conn=max_conn)
-            data = TimeSeries(downloaded_files, concatenate=True)
-            df = data.to_dataframe()
+            df = _read_cdf(downloaded_files)
+            if df is None:
+                from sunpy.timeseries import TimeSeries
+                data = TimeSeries(downloaded_files, concatenate=True)
+                df = data.to_dataframe()
 
             metadata = _get_metadata(dataset, downloaded_files[0])
 
@@ -415,8 +553,7 @@ def stereo_load(instrument, startdate, enddate, spacecraft='ahead', mag_coord='R
             if instrument.upper() == 'HET':
                 df = df.replace(metadata['Electron_Flux_FILLVAL'], np.nan)
             if instrument.upper() == 'LET':
-                df = df.replace(-1e+31, np.nan)
-                df = df.replace(-2147483648, np.nan)
+                df = df.replace([-1e+31, -2147483648], np.nan)
             if instrument.upper() == 'MAG':
                 df = df.replace(-1e+31, np.nan)
 